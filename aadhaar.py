@@ -0,0 +1,145 @@
+import os, hashlib, hmac
+from flask.views import MethodView
+from flask_smorest import abort
+from flask_jwt_extended import jwt_required
+from marshmallow import fields, validate
+from extensions import Blueprint, db, UTC_NOW
+from schemas import FastPathSchema, otp_verify_schema
+from otp import verify_otp
+from status import Status, StatusType
+
+# Server-side pepper for Aadhaar hashing; lives only in the environment, never in the DB.
+# Required: a missing pepper fails startup instead of falling back to a public value
+PEPPER = os.environ["AADHAAR_PEPPER"].encode()
+
+blp = Blueprint("aadhaar", "aadhaar", description="UIDAI Compliant Aadhaar Linking Lifecycle")
+
+# --- DATABASE MODELS ---
+
+class AadhaarRequestModel(db.Model):
+    __tablename__ = 'aadhaar_link_requests'
+    request_id = db.Column(db.String(50), primary_key=True)
+    # PRIVACY RULE: Store peppered HMAC-SHA256 instead of plaintext Aadhaar
+    aadhaar_hash = db.Column(db.String(64), nullable=False)
+    # Store masked version for display (XXXX-XXXX-1234)
+    masked_aadhaar = db.Column(db.String(15), nullable=False)
+    status = db.Column(StatusType, default=Status.PENDING_OTP)
+    otp_attempts = db.Column(db.SmallInteger, default=0, nullable=False)
+    consent_obtained = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, server_default=UTC_NOW)
+    updated_at = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
+
+# --- SCHEMAS ---
+class AadhaarStartSchema(FastPathSchema):
+    aadhaarNumber = fields.Str(required=True, validate=validate.Length(equal=12))
+    consentObtained = fields.Bool(required=True, validate=validate.Equal(True))
+
+    def fast_load(self, data):
+        number = data.get("aadhaarNumber")
+        if isinstance(number, str) and len(number) == 12 and data.get("consentObtained") in ("true", "True"):
+            return {"aadhaarNumber": number, "consentObtained": True}
+
+# Shared instance: passing the class would build a new Schema on every request
+aadhaar_start_schema = AadhaarStartSchema()
+
+# --- ROUTES ---
+
+@blp.route("/v1/aadhaar/link-requests")
+class AadhaarStart(MethodView):
+    @jwt_required()
+    @blp.arguments(aadhaar_start_schema, location="form")
+    def post(self, data):
+        """• POST /v1/aadhaar/link-requests (start)"""
+        request_id = f"ADR_{os.urandom(4).hex().upper()}"
+        
+        # Privacy Implementation: Create hash and masked version
+        a_hash = hmac.new(PEPPER, data['aadhaarNumber'].encode(), hashlib.sha256).hexdigest()
+        masked = "XXXX-XXXX-" + data['aadhaarNumber'][-4:]
+        
+        new_request = AadhaarRequestModel(
+            request_id=request_id,
+            aadhaar_hash=a_hash,
+            masked_aadhaar=masked,
+            consent_obtained=data['consentObtained']
+        )
+        db.session.add(new_request)
+        db.session.commit()
+        
+        return {
+            "requestId": request_id,
+            "status": new_request.status.name,
+            "message": "Aadhaar linking initiated. Consent verified."
+        }, 201
+
+@blp.route("/v1/aadhaar/link-requests/<string:requestId>/send-otp")
+class AadhaarSendOtp(MethodView):
+    @jwt_required()
+    def post(self, requestId):
+        """• POST /v1/aadhaar/link-requests/{requestId}/send-otp"""
+        request = AadhaarRequestModel.query.get_or_404(requestId)
+        request.status = Status.OTP_SENT
+        request.otp_attempts = 0
+        db.session.commit()
+        return {
+            "requestId": requestId,
+            "status": request.status.name,
+            "message": "OTP successfully triggered via UIDAI gateway"
+        }, 200
+
+@blp.route("/v1/aadhaar/link-requests/<string:requestId>/verify-otp")
+class AadhaarVerifyOtp(MethodView):
+    @jwt_required()
+    @blp.arguments(otp_verify_schema, location="form")
+    def post(self, data, requestId):
+        """• POST /v1/aadhaar/link-requests/{requestId}/verify-otp"""
+        request = verify_otp(AadhaarRequestModel, requestId, data['otp'], "Aadhaar OTP must be sent before it can be verified.")
+        return {
+            "requestId": requestId,
+            "status": request.status.name,
+            "message": "UIDAI OTP validation successful"
+        }, 200
+
+@blp.route("/v1/aadhaar/link-requests/<string:requestId>/finalize")
+class AadhaarFinalize(MethodView):
+    @jwt_required()
+    def post(self, requestId):
+        """• POST /v1/aadhaar/link-requests/{requestId}/finalize (link)"""
+        # Check-and-set in one atomic statement: no extra SELECT, and two concurrent
+        # finalize calls can't both see OTP_VERIFIED
+        row = db.session.execute(
+            db.update(AadhaarRequestModel)
+            .where(AadhaarRequestModel.request_id == requestId, AadhaarRequestModel.status == Status.OTP_VERIFIED)
+            .values(status=Status.LINKED)
+            .returning(AadhaarRequestModel.status, AadhaarRequestModel.masked_aadhaar)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if row is None:
+            db.get_or_404(AadhaarRequestModel, requestId)
+            abort(400, message="Aadhaar OTP must be verified before final link.")
+        
+        db.session.commit()
+        return {
+            "requestId": requestId,
+            "status": row.status.name,
+            "maskedAadhaar": row.masked_aadhaar,
+            "message": "Aadhaar successfully linked to the primary account."
+        }, 200
+
+@blp.route("/v1/aadhaar/link-requests/<string:requestId>")
+class AadhaarStatus(MethodView):
+    @jwt_required()
+    def get(self, requestId):
+        """• GET /v1/aadhaar/link-requests/{requestId} (status)"""
+        # Read-only: fetch just the columns we return, without building an ORM instance
+        row = db.session.execute(
+            db.select(AadhaarRequestModel.status, AadhaarRequestModel.masked_aadhaar, AadhaarRequestModel.updated_at)
+            .where(AadhaarRequestModel.request_id == requestId)
+        ).first()
+        if row is None:
+            abort(404)
+        return {
+            "requestId": requestId,
+            "status": row.status.name,
+            "maskedAadhaar": row.masked_aadhaar,
+            "updatedAt": row.updated_at # serialized as ISO 8601 UTC ("...Z") by OrjsonProvider
+        }, 200
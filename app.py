@@ -1,132 +1,110 @@
-import uuid, os
-from datetime import datetime
+import os
 from flask import Flask
-from flask.views import MethodView
-from flask_smorest import Api, Blueprint, abort
-from flask_jwt_extended import JWTManager, create_access_token, jwt_required
-from flask_sqlalchemy import SQLAlchemy
-from marshmallow import Schema, fields, validate
-
-app = Flask(__name__)
-
-# --- CONFIGURATION ---
-app.config.update({
-    "API_TITLE": "KYC Onboarding Service",
-    "API_VERSION": "v1",
-    "OPENAPI_VERSION": "3.0.3",
-    "OPENAPI_URL_PREFIX": "/",
-    "OPENAPI_SWAGGER_UI_PATH": "/swagger-ui",
-    "OPENAPI_SWAGGER_UI_URL": "https://cdn.jsdelivr.net/npm/swagger-ui-dist/",
-    # Persistent Database Connection
-    "SQLALCHEMY_DATABASE_URI": os.getenv("DATABASE_URL", "postgresql://admin:securepassword@db:5432/bank_onboarding_db"),
-    "SQLALCHEMY_TRACK_MODIFICATIONS": False,
-    "JWT_SECRET_KEY": os.getenv("JWT_SECRET_KEY", "bank-fixed-secret-key"),
-    "API_SPEC_OPTIONS": {
-        "security": [{"bearerAuth": []}],
-        "components": {"securitySchemes": {"bearerAuth": {"type": "http", "scheme": "bearer", "bearerFormat": "JWT"}}}
-    }
-})
-
-# Initialize Database and Security
-db = SQLAlchemy(app)
-api = Api(app)
-jwt = JWTManager(app)
-blp = Blueprint("kyc", "kyc", description="KYC Operations")
-
-# --- DATABASE MODELS ---
-
-class SessionModel(db.Model):
-    __tablename__ = 'kyc_sessions'
-    id = db.Column(db.String(50), primary_key=True)
-    kyc_purpose = db.Column(db.String(100))
-    jurisdiction = db.Column(db.String(10))
-    status = db.Column(db.String(20), default="CREATED")
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    # Relationship to track documents for the summary
-    documents = db.relationship("DocumentModel", backref="session", lazy=True)
-
-class DocumentModel(db.Model):
-    __tablename__ = 'kyc_documents'
-    id = db.Column(db.String(50), primary_key=True)
-    session_id = db.Column(db.String(50), db.ForeignKey('kyc_sessions.id'), nullable=False)
-    document_type = db.Column(db.String(50))
-    side = db.Column(db.String(10))
-    country = db.Column(db.String(50))
-    state = db.Column(db.String(20), default="UPLOADED")
-    uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
-
-# --- SCHEMAS ---
-
-class SessionSchema(Schema):
-    kycPurpose = fields.Str(required=True)
-    jurisdiction = fields.Str(required=True, validate=validate.OneOf(['IN']))
-    customer = fields.Dict(required=True)
-
-class KycDocSchema(Schema):
-    documentType = fields.Str(required=True, validate=validate.OneOf(['PAN', 'AADHAAR', 'PASSPORT', 'VOTER_ID']))
-    side = fields.Str(required=True, validate=validate.OneOf(['FRONT', 'BACK']))
-    country = fields.Str(required=True)
-
-# --- ROUTES ---
-
-@blp.route("/login")
-class Login(MethodView):
-    def post(self):
-        return {"access_token": create_access_token(identity="admin")}
-
-@blp.route("/v1/kyc/sessions")
-class Sessions(MethodView):
-    @jwt_required()
-    @blp.arguments(SessionSchema)
-    def post(self, data):
-        session_id = f"sess_{uuid.uuid4().hex[:8].upper()}"
-        new_session = SessionModel(
-            id=session_id,
-            kyc_purpose=data['kycPurpose'],
-            jurisdiction=data['jurisdiction']
-        )
-        db.session.add(new_session)
-        db.session.commit()
-        return {"sessionId": new_session.id, "status": new_session.status}, 201
-
-@blp.route("/v1/kyc/sessions/<string:sessionId>/documents")
-class Docs(MethodView):
-    @jwt_required()
-    @blp.arguments(KycDocSchema, location="form")
-    def post(self, data, sessionId):
-        # Verify session exists first
-        session = SessionModel.query.get_or_404(sessionId)
-        
-        doc_id = f"doc_{uuid.uuid4().hex[:8].upper()}"
-        new_doc = DocumentModel(
-            id=doc_id,
-            session_id=sessionId,
-            document_type=data['documentType'],
-            side=data['side'],
-            country=data['country']
-        )
-        db.session.add(new_doc)
-        db.session.commit()
-        return {"documentId": new_doc.id, "status": new_doc.state}, 201
-
-@blp.route("/v1/kyc/sessions/<string:sessionId>/summary")
-class Summary(MethodView):
-    @jwt_required()
-    def get(self, sessionId):
-        session = SessionModel.query.get_or_404(sessionId)
-        docs = [{"id": d.id, "type": d.document_type, "status": d.state} for d in session.documents]
-        
-        return {
-            "sessionId": sessionId,
-            "status": session.status,
-            "documentCount": len(docs),
-            "documents": docs
-        }, 200
-
-api.register_blueprint(blp)
+from sqlalchemy import event
+from extensions import db, api, jwt
+from json_provider import OrjsonProvider
+from migrate import upgrade
+from auth import blp as auth_blp
+from kyc import blp as kyc_blp
+from pan import blp as pan_blp
+from aadhaar import blp as aadhaar_blp
+
+# session.info key set once the current transaction has issued a write (flushed ORM
+# changes or an INSERT/UPDATE/DELETE statement); cleared when the transaction ends
+WROTE = "wrote"
+
+@event.listens_for(db.session, "after_flush")
+def _mark_flush(session, flush_context):
+    session.info[WROTE] = True
+
+@event.listens_for(db.session, "do_orm_execute")
+def _mark_dml(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[WROTE] = True
+
+@event.listens_for(db.session, "after_commit")
+@event.listens_for(db.session, "after_rollback")
+def _clear_write(session):
+    session.info.pop(WROTE, None)
+
+def create_app(config=None):
+    """Build the onboarding app with the KYC, PAN and Aadhaar APIs on one
+    connection pool, API spec and JWT manager."""
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+
+    # --- CONFIGURATION ---
+    app.config.update({
+        "API_TITLE": "Bank Onboarding Services",
+        "API_VERSION": "v1",
+        "OPENAPI_VERSION": "3.0.3",
+        "OPENAPI_URL_PREFIX": "/",
+        "OPENAPI_SWAGGER_UI_PATH": "/swagger-ui",
+        "OPENAPI_SWAGGER_UI_URL": "https://cdn.jsdelivr.net/npm/swagger-ui-dist/",
+        # Database connection for PostgreSQL
+        "SQLALCHEMY_DATABASE_URI": os.getenv("DATABASE_URL", "postgresql+psycopg://admin:securepassword@db:5432/bank_onboarding_db"),
+        "SQLALCHEMY_TRACK_MODIFICATIONS": False,
+        # Keep a warm pool of connections so requests don't pay connect/teardown each time.
+        # The pool is per Gunicorn worker: workers * (pool_size + max_overflow) must stay
+        # below Postgres max_connections (see gunicorn.conf.py)
+        "SQLALCHEMY_ENGINE_OPTIONS": {
+            "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 5)),
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+            "pool_use_lifo": True,
+            # psycopg 3 prepares a query server-side once it has run this many times on a
+            # connection, so the hot point lookups/updates skip parse and plan. 5 is
+            # psycopg's default; it is pinned here so the behaviour is explicit
+            "connect_args": {"prepare_threshold": 5}
+        },
+        "JWT_SECRET_KEY": os.getenv("JWT_SECRET_KEY", "bank-fixed-secret-key"),
+        "API_SPEC_OPTIONS": {
+            "security": [{"bearerAuth": []}],
+            "components": {
+                "securitySchemes": {
+                    "bearerAuth": {
+                        "type": "http",
+                        "scheme": "bearer",
+                        "bearerFormat": "JWT",
+                        "description": "Enter: Bearer <your_token>"
+                    }
+                }
+            }
+        }
+    })
+    app.config.update(config or {})
+
+    # Initialize Database, API, and Security
+    db.init_app(app)
+    api.init_app(app)
+    jwt.init_app(app)
+    for blp in (auth_blp, kyc_blp, pan_blp, aadhaar_blp):
+        api.register_blueprint(blp)
+
+    @app.teardown_appcontext
+    def end_read_transaction(exc):
+        # psycopg drops every prepared statement on ROLLBACK, which is how the session
+        # would otherwise end read-only transactions. Runs before Flask-SQLAlchemy's
+        # own teardown; a transaction that wrote anything (e.g. a handler that updated
+        # a row and then aborted) or raised still rolls back.
+        # Teardown functions are not guarded by Flask, so a failed commit must not
+        # escape and skip the session removal that returns the connection to the pool.
+        session = db.session()
+        wrote = session.info.get(WROTE) or session.new or session.dirty or session.deleted
+        if exc is None and session.in_transaction() and not wrote:
+            try:
+                session.commit()
+            except Exception:
+                session.rollback()
+
+    return app
 
 if __name__ == "__main__":
-    # Create tables before starting the app
+    app = create_app()
     with app.app_context():
-        db.create_all()
-    app.run(host="0.0.0.0", port=5001)
\ No newline at end of file
+        upgrade() # Migrates tables left by earlier versions of the models
+        db.create_all() # Creates tables in the Postgres container
+    # Containers serve the app through Gunicorn (see gunicorn.conf.py); the dev server is opt-in
+    if os.getenv("DEV"):
+        app.run(host="0.0.0.0", port=5001)
@@ -0,0 +1,11 @@
+from flask.views import MethodView
+from flask_jwt_extended import create_access_token
+from extensions import Blueprint
+
+blp = Blueprint("auth", "auth", description="Access tokens for the onboarding APIs")
+
+@blp.route("/login")
+class Login(MethodView):
+    def post(self):
+        """Step 0: Get Token for Swagger Authorize"""
+        return {"access_token": create_access_token(identity="admin")}
@@ -0,0 +1,18 @@
+import flask_smorest
+from flask_smorest import Api
+from flask_sqlalchemy import SQLAlchemy
+from json_provider import OrjsonFlaskParser
+from jwt_cache import CachedJWTManager
+
+# Shared by every blueprint and bound to the app in create_app(), so all
+# services use one connection pool, one API spec and one JWT verifier cache.
+db = SQLAlchemy()
+api = Api()
+jwt = CachedJWTManager()
+
+# Timestamps are generated by Postgres as naive UTC, matching the existing columns
+UTC_NOW = db.func.timezone('utc', db.func.now())
+
+class Blueprint(flask_smorest.Blueprint):
+    """flask-smorest Blueprint whose request arguments are parsed with orjson; used by every API."""
+    ARGUMENTS_PARSER = OrjsonFlaskParser()
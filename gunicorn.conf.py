@@ -0,0 +1,22 @@
+import multiprocessing, os
+
+# Gunicorn settings for the onboarding app (KYC, PAN and Aadhaar APIs in one process).
+# Ports are passed on the command line, e.g.
+#   gunicorn -c gunicorn.conf.py -b 0.0.0.0:5001 -b 0.0.0.0:5002 -b 0.0.0.0:5003 'app:create_app()'
+
+# --- WORKERS ---
+# The handlers are I/O bound (Postgres round-trips), so cooperative gevent
+# workers keep many requests in flight per process instead of blocking on each query,
+# so one worker per core is enough (2*CPU+1 is the sync-worker rule of thumb).
+# cpu_count() sees the node's cores, not a container's CPU limit: set WEB_CONCURRENCY
+# explicitly in containers.
+#
+# Every worker owns its own SQLAlchemy pool (DB_POOL_SIZE + DB_MAX_OVERFLOW, see
+# app.py), so keep  workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) < Postgres max_connections
+# (100 by default), leaving headroom for other clients.
+worker_class = "gevent"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_connections = int(os.getenv("WORKER_CONNECTIONS", 1000))
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+accesslog = "-"
@@ -0,0 +1,29 @@
+import orjson
+from flask.json.provider import DefaultJSONProvider
+from webargs import core
+from webargs.flaskparser import FlaskParser, is_json_request
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes/decodes with orjson instead of the stdlib json module.
+
+    Types orjson does not handle natively (Decimal, objects with __html__, ...)
+    fall back to Flask's default serializer. Datetimes are written in C as
+    ISO 8601 with a ``Z`` suffix; naive values are treated as UTC.
+    """
+
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=kwargs.get("default", self.default), option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class OrjsonFlaskParser(FlaskParser):
+    """webargs parser that decodes JSON request bodies with orjson instead of the stdlib."""
+
+    def _raw_load_json(self, req):
+        if not is_json_request(req):
+            return core.missing
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so webargs' 400 handling still applies
+        return orjson.loads(req.get_data(cache=True))
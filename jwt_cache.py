@@ -0,0 +1,78 @@
+import hmac, threading, time
+import jwt as pyjwt
+from cachetools import TTLCache
+from flask_jwt_extended import JWTManager
+from jwt.algorithms import HMACAlgorithm
+
+class PrecomputedHMACAlgorithm(HMACAlgorithm):
+    """HMAC JWS algorithm that keeps the keyed hash state for each secret.
+
+    ``hmac.new`` hashes the inner and outer key pads on every call; here that
+    happens once per key and each signature starts from a ``copy()`` of the
+    prepared state. PyJWT's key validation (asymmetric-key and JWK sniffing)
+    is likewise remembered per key instead of re-run on every token.
+    """
+
+    # The app signs with one JWT_SECRET_KEY; a small bound covers key rotation
+    MAX_KEYS = 8
+
+    def __init__(self, hash_alg):
+        super().__init__(hash_alg)
+        self._prepared = {}
+        self._schedules = {}
+
+    def prepare_key(self, key):
+        prepared = self._prepared.get(key)
+        if prepared is None:
+            prepared = super().prepare_key(key)
+            if len(self._prepared) >= self.MAX_KEYS:
+                self._prepared.clear()
+            self._prepared[key] = prepared
+        return prepared
+
+    def sign(self, msg, key):
+        schedule = self._schedules.get(key)
+        if schedule is None:
+            schedule = hmac.new(key, digestmod=self.hash_alg)
+            if len(self._schedules) >= self.MAX_KEYS:
+                self._schedules.clear()
+            self._schedules[key] = schedule
+        mac = schedule.copy()
+        mac.update(msg)
+        return mac.digest()
+
+class CachedJWTManager(JWTManager):
+    """JWTManager that remembers verified tokens for a short window.
+
+    Clients replay the same access token across a whole onboarding flow, so
+    the signature check and claim parsing only need to run the first time a
+    token is seen. Revocation and user-claim checks are performed by
+    ``@jwt_required()`` after decoding and are therefore not cached.
+    """
+
+    def __init__(self, app=None, add_context_processor=False, maxsize=10_000, ttl=30):
+        # TTL stays well below JWT_ACCESS_TOKEN_EXPIRES (15 minutes by default)
+        self._verified = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._verified_lock = threading.Lock()
+        super().__init__(app, add_context_processor)
+
+    def init_app(self, app, add_context_processor=False):
+        # flask-jwt-extended signs and verifies through PyJWT's global algorithm registry
+        pyjwt.unregister_algorithm("HS256")
+        pyjwt.register_algorithm("HS256", PrecomputedHMACAlgorithm(HMACAlgorithm.SHA256))
+        super().init_app(app, add_context_processor)
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        # CSRF double-submit and expired-token decodes are rare; always verify those
+        if csrf_value is not None or allow_expired:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        with self._verified_lock:
+            decoded = self._verified.get(encoded_token)
+        if decoded is not None and decoded.get("exp", float("inf")) > time.time():
+            return decoded
+
+        decoded = super()._decode_jwt_from_config(encoded_token)
+        with self._verified_lock:
+            self._verified[encoded_token] = decoded
+        return decoded
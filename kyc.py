@@ -0,0 +1,156 @@
+import os
+from flask import current_app
+from flask.views import MethodView
+from flask_smorest import abort
+from flask_jwt_extended import jwt_required
+from marshmallow import fields, validate
+from extensions import Blueprint, db, UTC_NOW
+from schemas import FastPathSchema
+from status import Status, StatusType, status_name
+
+blp = Blueprint("kyc", "kyc", description="KYC Operations")
+
+# --- DATABASE MODELS ---
+
+class SessionModel(db.Model):
+    __tablename__ = 'kyc_sessions'
+    id = db.Column(db.String(50), primary_key=True)
+    kyc_purpose = db.Column(db.String(100))
+    jurisdiction = db.Column(db.String(10))
+    status = db.Column(StatusType, default=Status.CREATED)
+    created_at = db.Column(db.DateTime, server_default=UTC_NOW)
+    # Relationship to track documents for the summary
+    documents = db.relationship("DocumentModel", backref="session", lazy=True)
+
+class DocumentModel(db.Model):
+    __tablename__ = 'kyc_documents'
+    # Serves session.documents lookups; INCLUDE lets the summary be an index-only scan
+    __table_args__ = (
+        db.Index('ix_docs_session_state', 'session_id', 'state', postgresql_include=['id', 'document_type']),
+    )
+    id = db.Column(db.String(50), primary_key=True)
+    session_id = db.Column(db.String(50), db.ForeignKey('kyc_sessions.id'), nullable=False)
+    document_type = db.Column(db.String(50))
+    side = db.Column(db.String(10))
+    country = db.Column(db.String(50))
+    state = db.Column(StatusType, default=Status.UPLOADED)
+    uploaded_at = db.Column(db.DateTime, server_default=UTC_NOW)
+
+# --- SCHEMAS ---
+
+DOCUMENT_TYPES = ('PAN', 'AADHAAR', 'PASSPORT', 'VOTER_ID')
+DOCUMENT_SIDES = ('FRONT', 'BACK')
+# Upper bound for one documents:batch request (a single INSERT in one transaction)
+MAX_BATCH_DOCUMENTS = 50
+
+class SessionSchema(FastPathSchema):
+    kycPurpose = fields.Str(required=True)
+    jurisdiction = fields.Str(required=True, validate=validate.OneOf(['IN']))
+    customer = fields.Dict(required=True)
+
+    def fast_load(self, data):
+        purpose, customer = data.get("kycPurpose"), data.get("customer")
+        if isinstance(purpose, str) and isinstance(customer, dict) and data.get("jurisdiction") == "IN":
+            return {"kycPurpose": purpose, "jurisdiction": "IN", "customer": customer}
+
+class KycDocSchema(FastPathSchema):
+    documentType = fields.Str(required=True, validate=validate.OneOf(DOCUMENT_TYPES))
+    side = fields.Str(required=True, validate=validate.OneOf(DOCUMENT_SIDES))
+    country = fields.Str(required=True)
+
+    def fast_load(self, data):
+        doc_type, side, country = data.get("documentType"), data.get("side"), data.get("country")
+        if doc_type in DOCUMENT_TYPES and side in DOCUMENT_SIDES and isinstance(country, str):
+            return {"documentType": doc_type, "side": side, "country": country}
+
+# Shared instances: passing the class would build a new Schema on every request
+session_schema = SessionSchema()
+kyc_doc_schema = KycDocSchema()
+kyc_doc_batch_schema = KycDocSchema(many=True)
+
+# --- ROUTES ---
+
+@blp.route("/v1/kyc/sessions")
+class Sessions(MethodView):
+    @jwt_required()
+    @blp.arguments(session_schema)
+    def post(self, data):
+        session_id = f"sess_{os.urandom(4).hex().upper()}"
+        new_session = SessionModel(
+            id=session_id,
+            kyc_purpose=data['kycPurpose'],
+            jurisdiction=data['jurisdiction']
+        )
+        db.session.add(new_session)
+        db.session.commit()
+        return {"sessionId": new_session.id, "status": new_session.status.name}, 201
+
+@blp.route("/v1/kyc/sessions/<string:sessionId>/documents")
+class Docs(MethodView):
+    @jwt_required()
+    @blp.arguments(kyc_doc_schema, location="form")
+    def post(self, data, sessionId):
+        # Verify session exists first
+        session = SessionModel.query.get_or_404(sessionId)
+        
+        doc_id = f"doc_{os.urandom(4).hex().upper()}"
+        new_doc = DocumentModel(
+            id=doc_id,
+            session_id=sessionId,
+            document_type=data['documentType'],
+            side=data['side'],
+            country=data['country']
+        )
+        db.session.add(new_doc)
+        db.session.commit()
+        return {"documentId": new_doc.id, "status": new_doc.state.name}, 201
+
+@blp.route("/v1/kyc/sessions/<string:sessionId>/documents:batch")
+class DocsBatch(MethodView):
+    @jwt_required()
+    @blp.arguments(kyc_doc_batch_schema, validate=validate.Length(min=1, max=MAX_BATCH_DOCUMENTS))
+    def post(self, data, sessionId):
+        # Verify session exists first
+        SessionModel.query.get_or_404(sessionId)
+
+        rows = [{
+            "id": f"doc_{os.urandom(4).hex().upper()}",
+            "session_id": sessionId,
+            "document_type": d['documentType'],
+            "side": d['side'],
+            "country": d['country'],
+            "state": Status.UPLOADED
+        } for d in data]
+        # Single executemany INSERT instead of one INSERT per document. IDs are generated
+        # here, so the response is built from rows and keeps the order of the request.
+        db.session.execute(db.insert(DocumentModel), rows)
+        db.session.commit()
+        return {"documents": [{"documentId": r["id"], "status": r["state"].name} for r in rows]}, 201
+
+@blp.route("/v1/kyc/sessions/<string:sessionId>/summary")
+class Summary(MethodView):
+    @jwt_required()
+    def get(self, sessionId):
+        # Postgres builds the whole response body (json_agg over the documents) in one
+        # round trip; it is sent as-is, without materializing rows or dicts in Python
+        body = db.session.execute(
+            db.select(db.func.json_build_object(
+                'sessionId', SessionModel.id,
+                'status', status_name(SessionModel.status),
+                'documentCount', db.func.count(DocumentModel.id),
+                'documents', db.func.coalesce(
+                    db.func.json_agg(db.func.json_build_object(
+                        'id', DocumentModel.id,
+                        'type', DocumentModel.document_type,
+                        'status', status_name(DocumentModel.state)
+                    )).filter(DocumentModel.id.is_not(None)),
+                    db.text("'[]'::json")
+                )
+            ).cast(db.Text))
+            .outerjoin(DocumentModel, DocumentModel.session_id == SessionModel.id)
+            .where(SessionModel.id == sessionId)
+            .group_by(SessionModel.id)
+        ).scalar()
+        if body is None:
+            abort(404)
+        return current_app.response_class(body, mimetype="application/json")
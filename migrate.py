@@ -0,0 +1,104 @@
+"""Bring databases created by earlier versions of the models up to date.
+
+``db.create_all()`` only creates missing tables and never alters existing
+ones, so column changes are applied here. Every step inspects the live
+schema and does nothing when its change is already in place (or the table
+does not exist yet), so ``upgrade()`` is safe to run on every start; app.py
+runs it before ``create_all()``. Run ``python migrate.py`` to apply it alone.
+"""
+from sqlalchemy import SmallInteger, inspect, text
+from extensions import db
+from pan import hash_pan, mask_pan
+from status import Status
+
+def _columns(conn, table):
+    """Column info by name, or None if the table has not been created yet."""
+    inspector = inspect(conn)
+    if not inspector.has_table(table):
+        return None
+    return {column["name"]: column for column in inspector.get_columns(table)}
+
+# Timestamps moved from Python-side datetime.utcnow defaults to server_default=UTC_NOW
+TIMESTAMP_COLUMNS = (
+    ("kyc_sessions", "created_at"),
+    ("kyc_documents", "uploaded_at"),
+    ("pan_link_requests", "created_at"),
+    ("pan_link_requests", "updated_at"),
+    ("aadhaar_link_requests", "created_at"),
+    ("aadhaar_link_requests", "updated_at"),
+)
+
+def set_timestamp_defaults(conn):
+    for table, column in TIMESTAMP_COLUMNS:
+        columns = _columns(conn, table)
+        if columns and column in columns and columns[column]["default"] is None:
+            conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT timezone('utc', now())"))
+
+def hash_pan_numbers(conn):
+    """pan_number (plaintext) was replaced by a peppered pan_hash plus masked_pan."""
+    columns = _columns(conn, "pan_link_requests")
+    if not columns or "pan_number" not in columns:
+        return
+    conn.execute(text("ALTER TABLE pan_link_requests ADD COLUMN IF NOT EXISTS pan_hash VARCHAR(64)"))
+    conn.execute(text("ALTER TABLE pan_link_requests ADD COLUMN IF NOT EXISTS masked_pan VARCHAR(10)"))
+    rows = conn.execute(text("SELECT request_id, pan_number FROM pan_link_requests WHERE pan_hash IS NULL")).all()
+    if rows:
+        conn.execute(
+            text("UPDATE pan_link_requests SET pan_hash = :pan_hash, masked_pan = :masked_pan WHERE request_id = :request_id"),
+            [{"request_id": r.request_id, "pan_hash": hash_pan(r.pan_number), "masked_pan": mask_pan(r.pan_number)} for r in rows]
+        )
+    conn.execute(text("ALTER TABLE pan_link_requests ALTER COLUMN pan_hash SET NOT NULL"))
+    conn.execute(text("ALTER TABLE pan_link_requests ALTER COLUMN masked_pan SET NOT NULL"))
+    conn.execute(text("ALTER TABLE pan_link_requests DROP COLUMN pan_number"))
+
+# Lifecycle states moved from VARCHAR names to SMALLINT Status values
+STATUS_COLUMNS = (
+    ("kyc_sessions", "status"),
+    ("kyc_documents", "state"),
+    ("pan_link_requests", "status"),
+    ("aadhaar_link_requests", "status"),
+)
+
+def convert_status_columns(conn):
+    for table, column in STATUS_COLUMNS:
+        columns = _columns(conn, table)
+        if not columns or column not in columns or isinstance(columns[column]["type"], SmallInteger):
+            continue
+        whens = " ".join(f"WHEN '{member.name}' THEN {member.value}" for member in Status)
+        conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT"))
+        conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE SMALLINT USING CASE {column} {whens} END"))
+
+# Failed-OTP counter for the per-request attempt limit
+OTP_ATTEMPT_TABLES = ("pan_link_requests", "aadhaar_link_requests")
+
+def add_otp_attempts(conn):
+    for table in OTP_ATTEMPT_TABLES:
+        if _columns(conn, table) is not None:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS otp_attempts SMALLINT NOT NULL DEFAULT 0"))
+
+# Link requests are only looked up by primary key, and an index on the frequently
+# updated status column would stop those updates from being HOT (in-place)
+DROPPED_INDEXES = ("ix_pan_status", "ix_aadhaar_status")
+
+def sync_indexes(conn):
+    """create_all() only creates indexes for the tables it creates itself."""
+    for name in DROPPED_INDEXES:
+        conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    inspector = inspect(conn)
+    for table in db.metadata.sorted_tables:
+        if inspector.has_table(table.name):
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+STEPS = (set_timestamp_defaults, hash_pan_numbers, convert_status_columns, add_otp_attempts, sync_indexes)
+
+def upgrade():
+    """Apply every pending step in one transaction (needs an app context)."""
+    with db.engine.begin() as conn:
+        for step in STEPS:
+            step(conn)
+
+if __name__ == "__main__":
+    from app import create_app
+    with create_app().app_context():
+        upgrade()
@@ -0,0 +1,41 @@
+import hmac, os
+from flask_smorest import abort
+from extensions import db
+from status import Status
+
+# Wrong guesses allowed per OTP before the request must go back through send-otp
+MAX_OTP_ATTEMPTS = 5
+
+# The UIDAI / NSDL gateways are simulated in this demo: every OTP they "send" is the sandbox value.
+# Required: a missing value fails startup instead of falling back to a public one
+SANDBOX_OTP = os.environ["SANDBOX_OTP"].encode()
+
+def otp_matches(otp):
+    # Constant-time compare so response timing doesn't reveal how many leading digits were right
+    return hmac.compare_digest(otp.encode(), SANDBOX_OTP)
+
+def verify_otp(model, request_id, otp, not_sent_message):
+    """Check ``otp`` for a PAN/Aadhaar link request and mark it OTP_VERIFIED.
+
+    Aborts with 404 for an unknown request, 400 if no OTP is outstanding or
+    it is wrong, and 429 once MAX_OTP_ATTEMPTS wrong guesses burn the OTP.
+    Returns the committed request on success.
+    """
+    # Row lock so concurrent guesses can't slip past the attempt limit
+    request = db.get_or_404(model, request_id, with_for_update=True)
+    if request.status != Status.OTP_SENT:
+        abort(400, message=not_sent_message)
+    if not otp_matches(otp):
+        request.otp_attempts += 1
+        if request.otp_attempts >= MAX_OTP_ATTEMPTS:
+            # Burn this OTP; the client has to trigger a fresh one
+            request.status = Status.PENDING_OTP
+            request.otp_attempts = 0
+            db.session.commit()
+            abort(429, message="Too many incorrect OTP attempts. Please request a new OTP.")
+        db.session.commit()
+        # Not 401: clients read that as the bearer token being rejected
+        abort(400, message="Invalid OTP.")
+    request.status = Status.OTP_VERIFIED
+    db.session.commit()
+    return request
@@ -0,0 +1,152 @@
+import os, re, hashlib, hmac
+from flask.views import MethodView
+from flask_smorest import abort
+from flask_jwt_extended import jwt_required
+from marshmallow import fields, validate
+from extensions import Blueprint, db, UTC_NOW
+from schemas import FastPathSchema, otp_verify_schema
+from otp import verify_otp
+from status import Status, StatusType
+
+# Server-side pepper for PAN hashing; lives only in the environment, never in the DB.
+# Required: a missing pepper fails startup instead of falling back to a public value
+PEPPER = os.environ["PAN_PEPPER"].encode()
+
+def hash_pan(pan):
+    return hmac.new(PEPPER, pan.encode(), hashlib.sha256).hexdigest()
+
+def mask_pan(pan):
+    return "******" + pan[-4:]
+
+blp = Blueprint("pan", "pan", description="RBI Compliant PAN Linking Lifecycle")
+
+# --- DATABASE MODELS ---
+
+class PanRequestModel(db.Model):
+    __tablename__ = 'pan_link_requests'
+    request_id = db.Column(db.String(50), primary_key=True)
+    # PRIVACY RULE: Store peppered HMAC-SHA256 instead of plaintext PAN
+    pan_hash = db.Column(db.String(64), nullable=False)
+    # Store masked version for display (******234F)
+    masked_pan = db.Column(db.String(10), nullable=False)
+    customer_name = db.Column(db.String(100), nullable=False)
+    status = db.Column(StatusType, default=Status.PENDING_OTP)
+    otp_attempts = db.Column(db.SmallInteger, default=0, nullable=False)
+    created_at = db.Column(db.DateTime, server_default=UTC_NOW)
+    updated_at = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=UTC_NOW)
+
+# --- SCHEMAS ---
+# Compiled once at import: AAAAA9999A
+PAN_RE = re.compile(r"^[A-Z]{5}[0-9]{4}[A-Z]$")
+
+class PanStartSchema(FastPathSchema):
+    panNumber = fields.Str(required=True, validate=validate.Regexp(PAN_RE))
+    customerName = fields.Str(required=True)
+
+    def fast_load(self, data):
+        pan, name = data.get("panNumber"), data.get("customerName")
+        if isinstance(pan, str) and isinstance(name, str) and PAN_RE.match(pan):
+            return {"panNumber": pan, "customerName": name}
+
+# Shared instance: passing the class would build a new Schema on every request
+pan_start_schema = PanStartSchema()
+
+# --- ROUTES ---
+
+@blp.route("/v1/pan/link-requests")
+class PanStart(MethodView):
+    @jwt_required()
+    @blp.arguments(pan_start_schema, location="form")
+    def post(self, data):
+        """• POST /v1/pan/link-requests (start)"""
+        request_id = f"PAN_{os.urandom(4).hex().upper()}"
+        
+        # Privacy Implementation: Create hash and masked version
+        p_hash = hash_pan(data['panNumber'])
+        masked = mask_pan(data['panNumber'])
+        
+        new_request = PanRequestModel(
+            request_id=request_id,
+            pan_hash=p_hash,
+            masked_pan=masked,
+            customer_name=data['customerName']
+        )
+        db.session.add(new_request)
+        db.session.commit()
+        return {
+            "requestId": request_id,
+            "status": new_request.status.name,
+            "message": "Linking request initiated. Please send OTP."
+        }, 201
+
+@blp.route("/v1/pan/link-requests/<string:requestId>/send-otp")
+class PanSendOtp(MethodView):
+    @jwt_required()
+    def post(self, requestId):
+        """• POST /v1/pan/link-requests/{requestId}/send-otp"""
+        request = PanRequestModel.query.get_or_404(requestId)
+        request.status = Status.OTP_SENT
+        request.otp_attempts = 0
+        db.session.commit()
+        return {
+            "requestId": requestId,
+            "status": request.status.name,
+            "message": "OTP has been sent to registered mobile number"
+        }, 200
+
+@blp.route("/v1/pan/link-requests/<string:requestId>/verify-otp")
+class PanVerifyOtp(MethodView):
+    @jwt_required()
+    @blp.arguments(otp_verify_schema, location="form")
+    def post(self, data, requestId):
+        """• POST /v1/pan/link-requests/{requestId}/verify-otp"""
+        request = verify_otp(PanRequestModel, requestId, data['otp'], "OTP must be sent before it can be verified.")
+        return {
+            "requestId": requestId,
+            "status": request.status.name,
+            "message": "OTP verified successfully"
+        }, 200
+
+@blp.route("/v1/pan/link-requests/<string:requestId>/finalize")
+class PanFinalize(MethodView):
+    @jwt_required()
+    def post(self, requestId):
+        """• POST /v1/pan/link-requests/{requestId}/finalize (link)"""
+        # Check-and-set in one atomic statement: no extra SELECT, and two concurrent
+        # finalize calls can't both see OTP_VERIFIED
+        row = db.session.execute(
+            db.update(PanRequestModel)
+            .where(PanRequestModel.request_id == requestId, PanRequestModel.status == Status.OTP_VERIFIED)
+            .values(status=Status.LINKED)
+            .returning(PanRequestModel.status)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if row is None:
+            db.get_or_404(PanRequestModel, requestId)
+            abort(400, message="OTP must be verified before finalizing link.")
+        
+        db.session.commit()
+        return {
+            "requestId": requestId,
+            "status": row.status.name,
+            "message": "PAN has been successfully linked to the account"
+        }, 200
+
+@blp.route("/v1/pan/link-requests/<string:requestId>")
+class PanStatus(MethodView):
+    @jwt_required()
+    def get(self, requestId):
+        """• GET /v1/pan/link-requests/{requestId} (status)"""
+        # Read-only: fetch just the columns we return, without building an ORM instance
+        row = db.session.execute(
+            db.select(PanRequestModel.status, PanRequestModel.masked_pan, PanRequestModel.updated_at)
+            .where(PanRequestModel.request_id == requestId)
+        ).first()
+        if row is None:
+            abort(404)
+        return {
+            "requestId": requestId,
+            "status": row.status.name,
+            "pan_number": row.masked_pan,
+            "updatedAt": row.updated_at # serialized as ISO 8601 UTC ("...Z") by OrjsonProvider
+        }, 200
@@ -0,0 +1,37 @@
+from collections.abc import Mapping
+from marshmallow import EXCLUDE, Schema, fields, validate
+
+class FastPathSchema(Schema):
+    """Schema with a hand-specialised fast path for well-formed input.
+
+    Subclasses implement ``fast_load(data)`` for the fixed shape their endpoint
+    expects and return the deserialized dict, or ``None`` to fall back to the
+    generic marshmallow loader. Only mappings reach ``fast_load``; anything
+    unusual (non-object bodies, invalid values, missing keys) takes the
+    fallback, so validation errors are unchanged.
+    Unknown keys are dropped rather than rejected, on both paths.
+    """
+
+    class Meta:
+        unknown = EXCLUDE
+
+    def fast_load(self, data):
+        return None
+
+    def load(self, data, *, many=None, partial=None, unknown=None):
+        if not (many or self.many or partial) and isinstance(data, Mapping):
+            result = self.fast_load(data)
+            if result is not None:
+                return result
+        return super().load(data, many=many, partial=partial, unknown=unknown)
+
+class OtpVerifySchema(FastPathSchema):
+    otp = fields.Str(required=True, validate=validate.Length(equal=6))
+
+    def fast_load(self, data):
+        otp = data.get("otp")
+        if isinstance(otp, str) and len(otp) == 6:
+            return {"otp": otp}
+
+# Shared by the PAN and Aadhaar verify-otp endpoints
+otp_verify_schema = OtpVerifySchema()
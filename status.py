@@ -0,0 +1,30 @@
+from enum import IntEnum
+from sqlalchemy import SmallInteger, TypeDecorator, case
+
+class Status(IntEnum):
+    """Lifecycle states for link requests, KYC sessions and documents.
+
+    Stored as a 2-byte SMALLINT; responses render the member ``name``.
+    Values are persisted, so never renumber existing members.
+    """
+    PENDING_OTP = 0
+    OTP_SENT = 1
+    OTP_VERIFIED = 2
+    LINKED = 3
+    CREATED = 4
+    UPLOADED = 5
+
+class StatusType(TypeDecorator):
+    """SMALLINT column that reads and writes :class:`Status` members."""
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else int(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else Status(value)
+
+def status_name(column):
+    """SQL expression rendering a :class:`StatusType` column as its member name."""
+    return case({member: member.name for member in Status}, value=column)
@@ -0,0 +1,58 @@
+from flask_smorest import abort
+from extensions import db
+from pan import PanRequestModel
+from status import Status
+
+def _add_request(app):
+    with app.app_context():
+        db.session.add(PanRequestModel(
+            request_id="PAN_TEST", pan_hash="h", masked_pan="******234F", customer_name="n",
+            status=Status.OTP_VERIFIED
+        ))
+        db.session.commit()
+
+def _status(app):
+    with app.app_context():
+        return db.session.get(PanRequestModel, "PAN_TEST").status
+
+def test_autoflushed_write_rolls_back_on_abort(app, client):
+    _add_request(app)
+
+    @app.route("/probe/orm")
+    def probe_orm():
+        db.session.get(PanRequestModel, "PAN_TEST").status = Status.LINKED
+        db.session.execute(db.select(PanRequestModel.request_id)).all()  # autoflush empties session.dirty
+        abort(400)
+
+    assert client.get("/probe/orm").status_code == 400
+    assert _status(app) == Status.OTP_VERIFIED
+
+def test_core_update_rolls_back_on_abort(app, client):
+    _add_request(app)
+
+    @app.route("/probe/core")
+    def probe_core():
+        db.session.execute(db.update(PanRequestModel).values(status=Status.LINKED))
+        abort(400)
+
+    assert client.get("/probe/core").status_code == 400
+    assert _status(app) == Status.OTP_VERIFIED
+
+def test_read_transaction_is_committed(app, client):
+    _add_request(app)
+    seen = {}
+
+    @app.route("/probe/read")
+    def probe_read():
+        db.session.execute(db.select(PanRequestModel.status)).all()
+        seen["session"] = db.session()
+        return ""
+
+    client.get("/probe/read")
+    # Committed rather than rolled back, so psycopg keeps its prepared statements
+    assert not seen["session"].in_transaction()
+
+def test_status_endpoint(app, client, auth_headers):
+    _add_request(app)
+    body = client.get("/v1/pan/link-requests/PAN_TEST", headers=auth_headers).get_json()
+    assert body["status"] == "OTP_VERIFIED" and body["pan_number"] == "******234F"
@@ -0,0 +1,67 @@
+import hashlib, hmac, time
+from datetime import timedelta
+import jwt as pyjwt
+import pytest
+from flask import Flask
+from flask_jwt_extended import create_access_token, get_jwt_identity, jwt_required
+from jwt.algorithms import HMACAlgorithm
+from jwt_cache import CachedJWTManager, PrecomputedHMACAlgorithm
+
+SECRET = "test-secret-key-that-is-long-enough"
+
+def make_app(manager=None):
+    app = Flask(__name__)
+    app.config["JWT_SECRET_KEY"] = SECRET
+    (manager or CachedJWTManager()).init_app(app)
+
+    @app.route("/protected")
+    @jwt_required()
+    def protected():
+        return {"identity": get_jwt_identity()}
+
+    return app
+
+def _get(app, token):
+    return app.test_client().get("/protected", headers={"Authorization": f"Bearer {token}"})
+
+@pytest.mark.parametrize("key, msg", [(b"k", b"abc"), (SECRET.encode(), b"x" * 1000), (b"k" * 100, b"")])
+def test_sign_matches_hmac(key, msg):
+    algorithm = PrecomputedHMACAlgorithm(HMACAlgorithm.SHA256)
+    expected = hmac.new(key, msg, hashlib.sha256).digest()
+    assert algorithm.sign(msg, key) == expected
+    assert algorithm.sign(msg, key) == expected  # from the cached key schedule
+    assert algorithm.verify(msg, key, expected)
+
+def test_valid_token_is_accepted():
+    app = make_app()
+    with app.app_context():
+        token = create_access_token(identity="admin")
+    assert _get(app, token).get_json() == {"identity": "admin"}
+    assert _get(app, token).get_json() == {"identity": "admin"}
+
+def test_tampered_token_is_rejected():
+    app = make_app()
+    with app.app_context():
+        token = create_access_token(identity="admin")
+    header, payload, signature = token.split(".")
+    tampered_signature = ("A" if signature[0] != "A" else "B") + signature[1:]
+    assert _get(app, f"{header}.{payload}.{tampered_signature}").status_code != 200
+    forged = pyjwt.encode({**pyjwt.decode(token, options={"verify_signature": False}), "sub": "other"}, "wrong-key-of-sufficient-length!!")
+    assert _get(app, forged).status_code != 200
+
+def test_cached_token_is_rejected_after_exp():
+    app = make_app()
+    with app.app_context():
+        token = create_access_token(identity="admin", expires_delta=timedelta(seconds=1))
+    assert _get(app, token).status_code == 200  # now cached, with a TTL well past exp
+    time.sleep(2)
+    assert _get(app, token).status_code == 401
+
+def test_init_app_twice_keeps_hs256_working():
+    manager = CachedJWTManager()
+    first, second = make_app(manager), make_app(manager)
+    make_app()  # and a separate manager instance
+    assert isinstance(pyjwt.get_algorithm_by_name("HS256"), PrecomputedHMACAlgorithm)
+    with first.app_context():
+        token = create_access_token(identity="admin")
+    assert _get(second, token).get_json() == {"identity": "admin"}
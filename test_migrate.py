@@ -0,0 +1,81 @@
+import pytest
+from sqlalchemy import SmallInteger, inspect, text
+from extensions import db
+from migrate import upgrade
+from pan import hash_pan
+
+# Tables as created by the original per-service apps, with one row each
+BASELINE_SCHEMA = """
+DROP SCHEMA public CASCADE;
+CREATE SCHEMA public;
+CREATE TABLE kyc_sessions (id VARCHAR(50) PRIMARY KEY, kyc_purpose VARCHAR(100), jurisdiction VARCHAR(10),
+    status VARCHAR(20), created_at TIMESTAMP);
+CREATE TABLE kyc_documents (id VARCHAR(50) PRIMARY KEY, session_id VARCHAR(50) NOT NULL REFERENCES kyc_sessions (id),
+    document_type VARCHAR(50), side VARCHAR(10), country VARCHAR(50), state VARCHAR(20), uploaded_at TIMESTAMP);
+CREATE TABLE pan_link_requests (request_id VARCHAR(50) PRIMARY KEY, pan_number VARCHAR(10) NOT NULL,
+    customer_name VARCHAR(100) NOT NULL, status VARCHAR(30), created_at TIMESTAMP, updated_at TIMESTAMP);
+CREATE TABLE aadhaar_link_requests (request_id VARCHAR(50) PRIMARY KEY, aadhaar_hash VARCHAR(64) NOT NULL,
+    masked_aadhaar VARCHAR(15) NOT NULL, status VARCHAR(30), consent_obtained BOOLEAN,
+    created_at TIMESTAMP, updated_at TIMESTAMP);
+CREATE INDEX ix_pan_status ON pan_link_requests (status);
+INSERT INTO kyc_sessions VALUES ('sess_OLD', 'p', 'IN', 'CREATED', now());
+INSERT INTO kyc_documents VALUES ('doc_OLD', 'sess_OLD', 'PAN', 'FRONT', 'IN', 'UPLOADED', now());
+INSERT INTO pan_link_requests VALUES ('PAN_OLD', 'ABCDE1234F', 'n', 'OTP_VERIFIED', now(), now());
+INSERT INTO aadhaar_link_requests VALUES ('ADR_OLD', 'h', 'XXXX-XXXX-9012', 'OTP_SENT', true, now(), now());
+"""
+
+@pytest.fixture
+def baseline_app(app):
+    with app.app_context():
+        db.session.remove()
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql(BASELINE_SCHEMA)
+        upgrade()
+        upgrade()  # every step is a no-op the second time
+        db.create_all()
+    return app
+
+def _columns(table):
+    return {c["name"]: c for c in inspect(db.engine).get_columns(table)}
+
+def test_status_columns_become_smallint(baseline_app):
+    with baseline_app.app_context():
+        for table, column in (("kyc_sessions", "status"), ("kyc_documents", "state"),
+                              ("pan_link_requests", "status"), ("aadhaar_link_requests", "status")):
+            assert isinstance(_columns(table)[column]["type"], SmallInteger)
+        assert db.session.execute(text("SELECT status FROM pan_link_requests")).scalar() == 2  # OTP_VERIFIED
+
+def test_pan_number_is_hashed_and_dropped(baseline_app):
+    with baseline_app.app_context():
+        assert "pan_number" not in _columns("pan_link_requests")
+        row = db.session.execute(text("SELECT pan_hash, masked_pan FROM pan_link_requests")).one()
+        assert row.pan_hash == hash_pan("ABCDE1234F") and row.masked_pan == "******234F"
+
+def test_defaults_columns_and_indexes(baseline_app):
+    with baseline_app.app_context():
+        assert "timezone('utc'" in _columns("pan_link_requests")["updated_at"]["default"]
+        assert "timezone('utc'" in _columns("kyc_documents")["uploaded_at"]["default"]
+        assert _columns("aadhaar_link_requests")["otp_attempts"]["default"] == "0"
+        indexes = {i["name"] for t in ("kyc_documents", "pan_link_requests") for i in inspect(db.engine).get_indexes(t)}
+        assert indexes == {"ix_docs_session_state"}
+
+def test_legacy_rows_work_after_upgrade(baseline_app, client, auth_headers):
+    summary = client.get("/v1/kyc/sessions/sess_OLD/summary", headers=auth_headers).get_json()
+    assert summary["documents"] == [{"id": "doc_OLD", "type": "PAN", "status": "UPLOADED"}]
+    r = client.post("/v1/pan/link-requests/PAN_OLD/finalize", headers=auth_headers)
+    assert r.get_json()["status"] == "LINKED"
+    r = client.post("/v1/pan/link-requests", data={"panNumber": "ABCDE1234F", "customerName": "n"}, headers=auth_headers)
+    assert r.status_code == 201
+    status = client.get(f"/v1/pan/link-requests/{r.get_json()['requestId']}", headers=auth_headers).get_json()
+    assert status["updatedAt"] is not None
+
+def _schema():
+    inspector = inspect(db.engine)
+    return {t: {c["name"]: (str(c["type"]), c["nullable"], c["default"]) for c in inspector.get_columns(t)}
+            for t in inspector.get_table_names()}
+
+def test_upgrade_is_a_noop_on_a_current_schema(app):
+    with app.app_context():
+        before = _schema()
+        upgrade()
+        assert _schema() == before
@@ -0,0 +1,49 @@
+import pytest
+from aadhaar import AadhaarRequestModel
+from extensions import db
+from otp import MAX_OTP_ATTEMPTS, SANDBOX_OTP
+from pan import PanRequestModel
+from status import Status
+
+WRONG_OTP = "000000" if SANDBOX_OTP != b"000000" else "111111"
+
+@pytest.fixture(params=["pan", "aadhaar"])
+def link_request(request, app):
+    """URL of an OTP_SENT link request for each API."""
+    with app.app_context():
+        if request.param == "pan":
+            db.session.add(PanRequestModel(
+                request_id="REQ_TEST", pan_hash="h", masked_pan="******234F", customer_name="n",
+                status=Status.OTP_SENT
+            ))
+        else:
+            db.session.add(AadhaarRequestModel(
+                request_id="REQ_TEST", aadhaar_hash="h", masked_aadhaar="XXXX-XXXX-9012",
+                consent_obtained=True, status=Status.OTP_SENT
+            ))
+        db.session.commit()
+    return f"/v1/{request.param}/link-requests/REQ_TEST"
+
+def _verify(client, auth_headers, url, otp):
+    return client.post(f"{url}/verify-otp", data={"otp": otp}, headers=auth_headers)
+
+def test_correct_otp_verifies(client, auth_headers, link_request):
+    r = _verify(client, auth_headers, link_request, SANDBOX_OTP.decode())
+    assert r.status_code == 200
+    assert r.get_json()["status"] == "OTP_VERIFIED"
+
+def test_wrong_otp_is_400_not_401(client, auth_headers, link_request):
+    assert _verify(client, auth_headers, link_request, WRONG_OTP).status_code == 400
+
+def test_lockout_burns_the_otp(client, auth_headers, link_request):
+    codes = [_verify(client, auth_headers, link_request, WRONG_OTP).status_code for _ in range(MAX_OTP_ATTEMPTS)]
+    assert codes == [400] * (MAX_OTP_ATTEMPTS - 1) + [429]
+    assert client.get(link_request, headers=auth_headers).get_json()["status"] == "PENDING_OTP"
+    # Even the right OTP is refused until a new one is sent
+    assert _verify(client, auth_headers, link_request, SANDBOX_OTP.decode()).status_code == 400
+    assert client.post(f"{link_request}/send-otp", headers=auth_headers).status_code == 200
+    assert _verify(client, auth_headers, link_request, SANDBOX_OTP.decode()).status_code == 200
+
+def test_unknown_request_is_404(client, auth_headers):
+    r = client.post("/v1/pan/link-requests/NOPE/verify-otp", data={"otp": "123456"}, headers=auth_headers)
+    assert r.status_code == 404
@@ -0,0 +1,18 @@
+import pytest
+from marshmallow import ValidationError
+from schemas import otp_verify_schema
+from kyc import kyc_doc_schema, session_schema
+
+@pytest.mark.parametrize("schema", [session_schema, kyc_doc_schema, otp_verify_schema])
+@pytest.mark.parametrize("body", [[1, 2], "str", 5, None])
+def test_non_object_body_is_a_validation_error(schema, body):
+    # Must surface as marshmallow's 422 "Invalid input type", not an AttributeError (500)
+    with pytest.raises(ValidationError) as excinfo:
+        schema.load(body)
+    assert excinfo.value.messages == {"_schema": ["Invalid input type."]}
+
+def test_fast_path_matches_full_load():
+    body = {"documentType": "PAN", "side": "FRONT", "country": "IN", "extra": 1}
+    assert kyc_doc_schema.load(body) == kyc_doc_schema.load(body, partial=True) == {
+        "documentType": "PAN", "side": "FRONT", "country": "IN"
+    }